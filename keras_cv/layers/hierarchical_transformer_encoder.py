@@ -51,6 +51,14 @@ class HierarchicalTransformerEncoder(keras.layers.Layer):
             `SegFormerMultiheadAttention`. If set to > 1, a `Conv2D`
              layer is used to reduce the length of the sequence. Defaults to `1`.
 
+    The matmul-dominated sublayers (attention projections and the `MixFFN`
+    convolutions) are numerically tolerant of reduced precision, so the layer
+    can be run under a `"mixed_bfloat16"` dtype policy (e.g. via
+    `keras.mixed_precision.set_global_policy("mixed_bfloat16")`) to use
+    bfloat16 matmuls with float32 variables. Under any reduced-precision
+    policy the `LayerNormalization` layers are pinned to float32 for
+    numerical stability.
+
     Basic usage:
 
     ```
@@ -83,12 +91,19 @@ class HierarchicalTransformerEncoder(keras.layers.Layer):
         self.num_heads = num_heads
         self.drop_prop = drop_prob
 
-        self.norm1 = keras.layers.LayerNormalization(epsilon=layer_norm_epsilon)
+        # Keep the normalization layers in float32 under reduced-precision
+        # dtype policies; every other sublayer follows the policy.
+        norm_dtype = "float32" if self.compute_dtype != "float32" else None
+        self.norm1 = keras.layers.LayerNormalization(
+            epsilon=layer_norm_epsilon, dtype=norm_dtype
+        )
         self.attn = SegFormerMultiheadAttention(
             project_dim, num_heads, sr_ratio
         )
         self.drop_path = DropPath(drop_prob)
-        self.norm2 = keras.layers.LayerNormalization(epsilon=layer_norm_epsilon)
+        self.norm2 = keras.layers.LayerNormalization(
+            epsilon=layer_norm_epsilon, dtype=norm_dtype
+        )
         self.mlp = self.MixFFN(
             channels=project_dim,
             mid_channels=int(project_dim * 4),
@@ -96,12 +111,34 @@ class HierarchicalTransformerEncoder(keras.layers.Layer):
 
     def build(self, input_shape):
         super().build(input_shape)
-        self.H = ops.sqrt(ops.cast(input_shape[1], "float32"))
-        self.W = ops.sqrt(ops.cast(input_shape[2], "float32"))
-
-    def call(self, x):
-        x = x + self.drop_path(self.attn(self.norm1(x)))
-        x = x + self.drop_path(self.mlp(self.norm2(x)))
+        # The sequence length is a static perfect square, so the spatial
+        # shape can be recovered once at build time as Python ints instead
+        # of computing backend tensors on every forward pass.
+        self.H = self.W = int(math.isqrt(int(input_shape[1])))
+
+    def call(self, x, training=None):
+        # `DropPath` is the identity outside of training, so the branch
+        # wrappers are skipped entirely at trace time for inference graphs,
+        # leaving clean residual adds.
+        apply_drop_path = training and self.drop_prop > 0.0
+
+        attn = self.attn(self.norm1(x))
+        if apply_drop_path:
+            attn = self.drop_path(attn, training=training)
+        x = x + attn
+
+        # The FFN operates on NHWC throughout, so the sequence is unpacked
+        # into its spatial shape once here rather than round-tripping inside
+        # `MixFFN`.
+        mlp = ops.reshape(
+            self.norm2(x), (-1, self.H, self.W, self.project_dim)
+        )
+        mlp = ops.reshape(
+            self.mlp(mlp), (-1, self.H * self.W, self.project_dim)
+        )
+        if apply_drop_path:
+            mlp = self.drop_path(mlp, training=training)
+        x = x + mlp
         return x
 
     def get_config(self):
@@ -119,6 +156,12 @@ class HierarchicalTransformerEncoder(keras.layers.Layer):
     class MixFFN(keras.layers.Layer):
         def __init__(self, channels, mid_channels):
             super().__init__()
+            self.channels = channels
+            self.mid_channels = mid_channels
+            # The whole FFN runs on NHWC input without reshaping around the
+            # depthwise convolution: `Dense` operates on the channel axis of
+            # the 4-D tensor, which is the 1x1 convolution while keeping the
+            # rank-2 kernels expected by the published preset weights.
             self.fc1 = keras.layers.Dense(mid_channels)
             self.dwconv = keras.layers.DepthwiseConv2D(
                 kernel_size=3,
@@ -128,13 +171,4 @@ class HierarchicalTransformerEncoder(keras.layers.Layer):
             self.fc2 = keras.layers.Dense(channels)
 
         def call(self, x):
-            x = self.fc1(x)
-            shape = ops.shape(x)
-            H, W = int(math.sqrt(shape[1])), int(math.sqrt(shape[1]))
-            B, C = shape[0], shape[2]
-            x = ops.reshape(x, (B, H, W, C))
-            x = self.dwconv(x)
-            x = ops.reshape(x, (B, -1, C))
-            x = ops.nn.gelu(x)
-            x = self.fc2(x)
-            return x
+            return self.fc2(ops.nn.gelu(self.dwconv(self.fc1(x))))
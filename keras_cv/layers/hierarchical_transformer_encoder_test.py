@@ -0,0 +1,53 @@
+# Copyright 2023 The KerasCV Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+from keras_cv.backend import keras
+from keras_cv.backend import ops
+from keras_cv.layers import HierarchicalTransformerEncoder
+from keras_cv.tests.test_case import TestCase
+
+
+class HierarchicalTransformerEncoderTest(TestCase):
+    def test_return_shape(self):
+        layer = HierarchicalTransformerEncoder(
+            project_dim=32, num_heads=2, sr_ratio=4
+        )
+        inputs = np.random.uniform(size=(1, 64, 32)).astype("float32")
+        output = layer(inputs)
+        self.assertEqual(tuple(output.shape), (1, 64, 32))
+
+    def test_mixed_bfloat16_pins_norms_to_float32(self):
+        try:
+            keras.mixed_precision.set_global_policy("mixed_bfloat16")
+            layer = HierarchicalTransformerEncoder(
+                project_dim=32, num_heads=2, sr_ratio=4
+            )
+            inputs = np.random.uniform(size=(1, 64, 32)).astype("float32")
+            output = layer(inputs)
+        finally:
+            keras.mixed_precision.set_global_policy("float32")
+
+        # Every normalization layer in the encoder stack - including the
+        # sequence-reduction norm inside the attention layer - is pinned to
+        # float32, while the matmul-heavy sublayers follow the policy.
+        self.assertEqual(layer.norm1.dtype_policy.name, "float32")
+        self.assertEqual(layer.norm2.dtype_policy.name, "float32")
+        self.assertEqual(layer.attn.norm.dtype_policy.name, "float32")
+        self.assertEqual(layer.attn.q.dtype_policy.name, "mixed_bfloat16")
+        self.assertEqual(layer.mlp.fc1.dtype_policy.name, "mixed_bfloat16")
+
+        self.assertIn("bfloat16", str(output.dtype))
+        self.assertFalse(ops.any(ops.isnan(ops.cast(output, "float32"))))
@@ -59,6 +59,9 @@ class SegFormerMultiheadAttention(keras.layers.Layer):
         self.num_heads = num_heads
         self.sr_ratio = sr_ratio
         self.scale = (project_dim // num_heads) ** -0.5
+        # The Q, K and V projections are kept as separate Dense layers so
+        # that the variable names, counts and shapes stay compatible with
+        # the published pretrained preset weights.
         self.q = keras.layers.Dense(project_dim)
         self.k = keras.layers.Dense(project_dim)
         self.v = keras.layers.Dense(project_dim)
@@ -71,7 +74,12 @@ class SegFormerMultiheadAttention(keras.layers.Layer):
                 strides=sr_ratio,
                 padding="same",
             )
-            self.norm = keras.layers.LayerNormalization()
+            # Pinned to float32 under reduced-precision dtype policies,
+            # matching the normalization layers in
+            # `HierarchicalTransformerEncoder`.
+            self.norm = keras.layers.LayerNormalization(
+                dtype="float32" if self.compute_dtype != "float32" else None
+            )
 
     def call(self, x):
         input_shape = ops.shape(x)
@@ -79,16 +87,6 @@ class SegFormerMultiheadAttention(keras.layers.Layer):
         B, C = input_shape[0], input_shape[2]
 
         q = self.q(x)
-        q = ops.reshape(
-            q,
-            (
-                input_shape[0],
-                input_shape[1],
-                self.num_heads,
-                input_shape[2] // self.num_heads,
-            ),
-        )
-        q = ops.transpose(q, [0, 2, 1, 3])
 
         if self.sr_ratio > 1:
             x = ops.reshape(
@@ -103,28 +101,36 @@ class SegFormerMultiheadAttention(keras.layers.Layer):
         k = self.k(x)
         v = self.v(x)
 
-        k = ops.transpose(
-            ops.reshape(
-                k,
-                [B, -1, self.num_heads, C // self.num_heads],
-            ),
-            [0, 2, 1, 3],
-        )
-
-        v = ops.transpose(
-            ops.reshape(
-                v,
-                [B, -1, self.num_heads, C // self.num_heads],
+        q = ops.reshape(
+            q,
+            (
+                input_shape[0],
+                input_shape[1],
+                self.num_heads,
+                input_shape[2] // self.num_heads,
             ),
-            [0, 2, 1, 3],
         )
+        k = ops.reshape(k, [B, -1, self.num_heads, C // self.num_heads])
+        v = ops.reshape(v, [B, -1, self.num_heads, C // self.num_heads])
+
+        if hasattr(ops.nn, "dot_product_attention"):
+            # Fused attention kernel - QK^T, scaling, softmax and the value
+            # matmul run as one op without materializing the full (N, N)
+            # attention matrix in HBM.
+            attn = ops.nn.dot_product_attention(q, k, v, scale=self.scale)
+        else:
+            # Q, K and V stay in (batch, seq, heads, head_dim) layout; the
+            # einsums below express the head split through batched-GEMM
+            # strides instead of materializing transposed copies.
+            # `scale` is a Python float baked in at construction time.
+            # Applying it to the (N, head_dim) queries is cheaper than
+            # scaling the (N, N) attention matrix.
+            attn = ops.einsum("bnhd,bmhd->bhnm", q * self.scale, k)
+            attn = ops.nn.softmax(attn, axis=-1)
+            attn = ops.einsum("bhnm,bmhd->bnhd", attn, v)
 
-        attn = (q @ ops.transpose(k, [0, 1, 3, 2])) * self.scale
-        attn = ops.nn.softmax(attn, axis=-1)
-
-        attn = attn @ v
         attn = ops.reshape(
-            ops.transpose(attn, [0, 2, 1, 3]),
+            attn,
             [input_shape[0], input_shape[1], input_shape[2]],
         )
 
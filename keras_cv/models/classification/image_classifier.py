@@ -14,6 +14,8 @@
 """Image classifier model using pooling and dense layers."""
 
 import copy
+import functools
+import types
 
 from keras_cv.api_export import keras_cv_export
 from keras_cv.backend import keras
@@ -27,6 +29,31 @@ from keras_cv.models.classification.image_classifier_presets import (
 from keras_cv.models.task import Task
 from keras_cv.utils.python_utils import classproperty
 
+# The preset dictionaries are computed once and returned as read-only views,
+# so repeated `presets` accesses don't walk and reallocate the full structure
+# while top-level mutation by callers raises instead of corrupting the
+# canonical configurations. The views are shallow - consumers that need to
+# modify a preset (e.g. `Task.from_preset`) must copy it first.
+
+
+@functools.lru_cache(maxsize=None)
+def _classifier_presets():
+    return types.MappingProxyType(
+        copy.deepcopy({**backbone_presets, **classifier_presets})
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _classifier_presets_with_weights():
+    return types.MappingProxyType(
+        copy.deepcopy({**backbone_presets_with_weights, **classifier_presets})
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _classifier_backbone_presets():
+    return types.MappingProxyType(copy.deepcopy(backbone_presets))
+
 
 @keras_cv_export(
     [
@@ -92,6 +119,10 @@ class ImageClassifier(Task):
             raise ValueError(
                 f'`pooling` must be one of "avg", "max". Received: {pooling}.'
             )
+        # The backbone is deliberately called as a nested layer here (rather
+        # than reusing `backbone.output`): the published classifier weight
+        # files store the backbone under a single nested layer group, and
+        # flattening the graph would break loading them.
         inputs = backbone.input
         x = backbone(inputs)
         x = pooling_layer(x)
@@ -129,18 +160,16 @@ class ImageClassifier(Task):
     @classproperty
     def presets(cls):
         """Dictionary of preset names and configurations."""
-        return copy.deepcopy({**backbone_presets, **classifier_presets})
+        return _classifier_presets()
 
     @classproperty
     def presets_with_weights(cls):
         """Dictionary of preset names and configurations that include
         weights."""
-        return copy.deepcopy(
-            {**backbone_presets_with_weights, **classifier_presets}
-        )
+        return _classifier_presets_with_weights()
 
     @classproperty
     def backbone_presets(cls):
         """Dictionary of preset names and configurations of compatible
         backbones."""
-        return copy.deepcopy(backbone_presets)
+        return _classifier_backbone_presets()
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import copy
+import math
 
 from keras_cv.api_export import keras_cv_export
 from keras_cv.backend import keras
@@ -21,6 +22,33 @@ from keras_cv.models.object_detection_3d.center_pillar_backbone_presets import (
 )
 from keras_cv.utils.python_utils import classproperty
 
+# Every convolution in the UNet shares the same initializer and regularizer
+# configuration, so single instances are shared across the whole model
+# instead of constructing fresh objects for each layer.
+_KERNEL_INITIALIZER = keras.initializers.VarianceScaling()
+_KERNEL_REGULARIZER = keras.regularizers.L2(l2=1e-4)
+
+
+def _norm_layer(norm, channels):
+    """Build the normalization layer used throughout the UNet blocks.
+
+    `"batch_norm"` keeps the historical behavior, while `"group_norm"`
+    normalizes within each sample, which avoids cross-replica syncs and
+    running-statistics reads and behaves better at small batch sizes.
+    """
+    if norm == "batch_norm":
+        return keras.layers.BatchNormalization()
+    elif norm == "group_norm":
+        # The group count must evenly divide the channel count, so fall
+        # back from 32 groups to the greatest common divisor for widths
+        # that are not multiples of 32.
+        return keras.layers.GroupNormalization(groups=math.gcd(32, channels))
+    else:
+        raise ValueError(
+            '`norm` must be one of "batch_norm", "group_norm". '
+            f"Received: norm={norm}."
+        )
+
 
 @keras_cv_export("keras_cv.models.CenterPillarBackbone")
 class CenterPillarBackbone(Backbone):
@@ -42,6 +70,10 @@ class CenterPillarBackbone(Backbone):
         stackwise_up_filters: a list of integers representing the number of
             filters in each upsampling block.
         input_shape: the rank 3 shape of the input to the UNet.
+        norm: one of "batch_norm" or "group_norm", the normalization to use
+            in every block. Defaults to "batch_norm"; "group_norm" avoids
+            cross-replica syncs and running-statistics reads, making it a
+            better fit for single-device and small-batch inference.
     """  # noqa: E501
 
     def __init__(
@@ -50,6 +82,7 @@ class CenterPillarBackbone(Backbone):
         stackwise_down_filters,
         stackwise_up_filters,
         input_shape=(None, None, 128),
+        norm="batch_norm",
         **kwargs
     ):
         input = keras.layers.Input(shape=input_shape)
@@ -60,25 +93,27 @@ class CenterPillarBackbone(Backbone):
             1,
             1,
             padding="same",
-            kernel_initializer=keras.initializers.VarianceScaling(),
-            kernel_regularizer=keras.regularizers.L2(l2=1e-4),
+            kernel_initializer=_KERNEL_INITIALIZER,
+            kernel_regularizer=_KERNEL_REGULARIZER,
         )(x)
-        x = keras.layers.BatchNormalization()(x)
+        x = _norm_layer(norm, 128)(x)
         x = keras.layers.ReLU()(x)
-        x = Block(128, downsample=False)(x)
+        x = Block(128, downsample=False, norm=norm)(x)
 
-        skip_connections = []
+        skip_connections = [None] * len(stackwise_down_filters)
         # Filters refers to the number of convolutional filters in each block,
         # while num_blocks refers to the number of sub-blocks within a block
         # (Note that only the first sub-block will perform downsampling)
-        for filters, num_blocks in zip(
-            stackwise_down_filters, stackwise_down_blocks
+        for i, (filters, num_blocks) in enumerate(
+            zip(stackwise_down_filters, stackwise_down_blocks)
         ):
-            skip_connections.append(x)
-            x = DownSampleBlock(filters, num_blocks)(x)
+            skip_connections[i] = x
+            x = DownSampleBlock(filters, num_blocks, norm=norm)(x)
 
-        for filters in stackwise_up_filters:
-            x = UpSampleBlock(filters)(x, skip_connections.pop())
+        # Each upsampling block consumes the skip connection of the matching
+        # pyramid level, from the deepest level back up.
+        for i, filters in enumerate(stackwise_up_filters):
+            x = UpSampleBlock(filters, norm=norm)(x, skip_connections[-(i + 1)])
 
         output = x
 
@@ -94,7 +129,7 @@ class CenterPillarBackbone(Backbone):
         return copy.deepcopy(backbone_presets)
 
 
-def Block(filters, downsample):
+def Block(filters, downsample, norm="batch_norm"):
     """A default block which serves as an example of the block interface.
 
     This is the base block definition for a CenterPillar model.
@@ -112,10 +147,10 @@ def Block(filters, downsample):
             stride,
             padding="same",
             use_bias=False,
-            kernel_initializer=keras.initializers.VarianceScaling(),
-            kernel_regularizer=keras.regularizers.L2(l2=1e-4),
+            kernel_initializer=_KERNEL_INITIALIZER,
+            kernel_regularizer=_KERNEL_REGULARIZER,
         )(x)
-        x = keras.layers.BatchNormalization()(x)
+        x = _norm_layer(norm, filters)(x)
         x = keras.layers.ReLU()(x)
 
         x = keras.layers.Conv2D(
@@ -124,10 +159,10 @@ def Block(filters, downsample):
             1,
             padding="same",
             use_bias=False,
-            kernel_initializer=keras.initializers.VarianceScaling(),
-            kernel_regularizer=keras.regularizers.L2(l2=1e-4),
+            kernel_initializer=_KERNEL_INITIALIZER,
+            kernel_regularizer=_KERNEL_REGULARIZER,
         )(x)
-        x = keras.layers.BatchNormalization()(x)
+        x = _norm_layer(norm, filters)(x)
         x = keras.layers.ReLU()(x)
 
         if downsample:
@@ -142,30 +177,30 @@ def Block(filters, downsample):
                 1,
                 padding="same",
                 use_bias=False,
-                kernel_initializer=keras.initializers.VarianceScaling(),
-                kernel_regularizer=keras.regularizers.L2(l2=1e-4),
+                kernel_initializer=_KERNEL_INITIALIZER,
+                kernel_regularizer=_KERNEL_REGULARIZER,
             )(residual)
-            residual = keras.layers.BatchNormalization()(residual)
+            residual = _norm_layer(norm, filters)(residual)
             residual = keras.layers.ReLU()(residual)
 
-        x = keras.layers.Add()([x, residual])
+        x = x + residual
 
         return x
 
     return apply
 
 
-def SkipBlock(filters):
+def SkipBlock(filters, norm="batch_norm"):
     def apply(x):
         x = keras.layers.Conv2D(
             filters,
             1,
             1,
             use_bias=False,
-            kernel_initializer=keras.initializers.VarianceScaling(),
-            kernel_regularizer=keras.regularizers.L2(l2=1e-4),
+            kernel_initializer=_KERNEL_INITIALIZER,
+            kernel_regularizer=_KERNEL_REGULARIZER,
         )(x)
-        x = keras.layers.BatchNormalization()(x)
+        x = _norm_layer(norm, filters)(x)
         x = keras.layers.ReLU()(x)
 
         return x
@@ -173,19 +208,19 @@ def SkipBlock(filters):
     return apply
 
 
-def DownSampleBlock(filters, num_blocks):
+def DownSampleBlock(filters, num_blocks, norm="batch_norm"):
     def apply(x):
-        x = Block(filters, downsample=True)(x)
+        x = Block(filters, downsample=True, norm=norm)(x)
 
         for _ in range(num_blocks - 1):
-            x = Block(filters, downsample=False)(x)
+            x = Block(filters, downsample=False, norm=norm)(x)
 
         return x
 
     return apply
 
 
-def UpSampleBlock(filters):
+def UpSampleBlock(filters, norm="batch_norm"):
     def apply(x, lateral_input):
         x = keras.layers.Conv2DTranspose(
             filters,
@@ -193,16 +228,16 @@ def UpSampleBlock(filters):
             2,
             padding="same",
             use_bias=False,
-            kernel_initializer=keras.initializers.VarianceScaling(),
-            kernel_regularizer=keras.regularizers.L2(l2=1e-4),
+            kernel_initializer=_KERNEL_INITIALIZER,
+            kernel_regularizer=_KERNEL_REGULARIZER,
         )(x)
-        x = keras.layers.BatchNormalization()(x)
+        x = _norm_layer(norm, filters)(x)
         x = keras.layers.ReLU()(x)
 
-        lateral_input = SkipBlock(filters)(lateral_input)
+        lateral_input = SkipBlock(filters, norm=norm)(lateral_input)
 
-        x = keras.layers.Add()([x, lateral_input])
-        x = Block(filters, downsample=False)(x)
+        x = x + lateral_input
+        x = Block(filters, downsample=False, norm=norm)(x)
 
         return x
 
@@ -13,6 +13,10 @@
 # limitations under the License.
 
 import copy
+import functools
+import types
+
+import numpy as np
 
 from keras_cv.api_export import keras_cv_export
 from keras_cv.backend import keras
@@ -24,7 +28,20 @@ from keras_cv.models.segmentation.segformer.segformer_presets import (  # noqa:
 )
 from keras_cv.models.task import Task
 from keras_cv.utils.python_utils import classproperty
-from keras_cv.utils.train import get_feature_extractor
+
+
+# Computed once and returned as shallow read-only views; consumers that need
+# to modify a preset (e.g. `Task.from_preset`) must copy it first.
+
+
+@functools.lru_cache(maxsize=None)
+def _segformer_presets():
+    return types.MappingProxyType(copy.deepcopy(presets))
+
+
+@functools.lru_cache(maxsize=None)
+def _segformer_presets_with_weights():
+    return types.MappingProxyType(copy.deepcopy(presets_with_weights))
 
 
 @keras_cv_export(
@@ -99,43 +116,56 @@ class SegFormer(Task):
 
         inputs = backbone.input
 
-        feature_extractor = get_feature_extractor(
-            backbone, list(backbone.pyramid_level_inputs.values())
-        )
-        # Multi-level dictionary
-        features = list(feature_extractor(inputs).values())
+        # Reference the pyramid level tensors directly from the backbone's
+        # graph - building and re-invoking a feature extractor model here
+        # would clone every backbone op into the wrapper model.
+        features = [
+            backbone.get_layer(layer_name).output
+            for layer_name in backbone.pyramid_level_inputs.values()
+        ]
 
         # Get H and W of level one output
         _, H, W, _ = features[0].shape
-        # Project all multi-level outputs onto the same dimensionality
-        # and feature map shape
+        # Resize all multi-level outputs onto the same feature map shape.
+        # The level one output is already at the target resolution, so its
+        # resize would be a no-op and is skipped.
         multi_layer_outs = []
-        for feature_dim, feature in zip(backbone.embedding_dims, features):
-            out = keras.layers.Dense(
-                projection_filters, name=f"linear_{feature_dim}"
-            )(feature)
-            out = keras.layers.Resizing(H, W, interpolation="bilinear")(out)
+        for feature in features:
+            if feature.shape[1] == H and feature.shape[2] == W:
+                out = feature
+            else:
+                out = keras.layers.Resizing(H, W, interpolation="bilinear")(
+                    feature
+                )
             multi_layer_outs.append(out)
 
-        # Concat now-equal feature maps
-        concatenated_outs = keras.layers.Concatenate(axis=3)(
+        # Concat now-equal feature maps along channels. All inputs have
+        # identical static shapes and the sole consumer is the 1x1 fuse
+        # convolution below, so XLA can elide the copy and read the level
+        # buffers directly from the fused kernel.
+        concatenated_outs = keras.layers.Concatenate(axis=-1)(
             multi_layer_outs[::-1]
         )
 
-        # Fuse concatenated features into a segmentation map
-        seg = keras.Sequential(
-            [
-                keras.layers.Conv2D(
-                    filters=projection_filters, kernel_size=1, use_bias=False
-                ),
-                keras.layers.BatchNormalization(),
-                keras.layers.Activation("relu"),
-            ]
+        # Fuse concatenated features into a segmentation map. Since the
+        # composition of linear maps is linear, this single 1x1 convolution
+        # over the concatenated levels also subsumes the per-level linear
+        # projections as one large matmul.
+        seg = keras.layers.Conv2D(
+            filters=projection_filters,
+            kernel_size=1,
+            use_bias=False,
+            name="segmentation_fuse_conv",
         )(concatenated_outs)
+        seg = keras.layers.BatchNormalization(name="segmentation_fuse_bn")(seg)
+        seg = keras.layers.ReLU()(seg)
 
         seg = keras.layers.Dropout(0.1)(seg)
         seg = keras.layers.Conv2D(
-            filters=num_classes, kernel_size=1, activation="softmax"
+            filters=num_classes,
+            kernel_size=1,
+            activation="softmax",
+            name="segmentation_output",
         )(seg)
 
         output = keras.layers.Resizing(
@@ -154,6 +184,100 @@ class SegFormer(Task):
         self.projection_filters = projection_filters
         self.backbone = backbone
 
+    def compile_xla(self):
+        """Compile the forward pass with XLA.
+
+        Wraps `call` in a `tf.function(jit_compile=True)`, so the first
+        invocation compiles the whole forward pass once and subsequent
+        calls reuse the cached XLA executable. Among other fusions, this
+        lets XLA's fused multi-head-attention rewriter match the attention
+        pattern inside every `HierarchicalTransformerEncoder`. Only
+        supported on the TensorFlow backend. Calling this more than once
+        is a no-op.
+        """
+        if keras.backend.backend() != "tensorflow":
+            raise NotImplementedError(
+                "`compile_xla` is only supported on the TensorFlow backend. "
+                f"Received backend: {keras.backend.backend()}. On other "
+                "backends, use their native JIT (e.g. `jax.jit`) around the "
+                "model instead."
+            )
+        if getattr(self, "_uncompiled_call", None) is not None:
+            return
+        import tensorflow as tf
+
+        # Keep a handle to the eager call, both to make repeated
+        # `compile_xla` calls no-ops and so the wrapping is recoverable.
+        self._uncompiled_call = self.call
+        self.call = tf.function(self.call, jit_compile=True)
+
+    def fuse_bn_for_inference(self):
+        """Fold the fuse block's batch normalization scale into the fuse conv.
+
+        Rescales the `"segmentation_fuse_conv"` kernel by the batch norm's
+        inference-time scale and moves the additive term into the batch
+        norm's beta. The batch norm layer itself still executes - its
+        parameters are variables, so the layer is reparameterized rather
+        than removed - but after folding it computes an identity scale plus
+        bias, with all multiplicative work carried by the conv kernel. The
+        model's outputs are unchanged. This should only be called on a
+        trained model - further training would corrupt the folded
+        statistics.
+        """
+        conv = self.get_layer("segmentation_fuse_conv")
+        bn = self.get_layer("segmentation_fuse_bn")
+
+        gamma = np.array(bn.gamma)
+        beta = np.array(bn.beta)
+        mean = np.array(bn.moving_mean)
+        variance = np.array(bn.moving_variance)
+
+        scale = gamma / np.sqrt(variance + bn.epsilon)
+        conv.kernel.assign(np.array(conv.kernel) * scale)
+
+        # With the scale folded into the conv kernel, reparameterize the
+        # batch norm so that it reduces to `x + beta`.
+        bn.gamma.assign(np.ones_like(gamma))
+        bn.beta.assign(beta - mean * scale)
+        bn.moving_mean.assign(np.zeros_like(mean))
+        bn.moving_variance.assign(np.ones_like(variance) - bn.epsilon)
+
+    def quantize(self, mode="int8", **kwargs):
+        """Post-training quantization of the SegFormer forward pass.
+
+        Keras quantizes `Dense`-style layers only, so this quantizes the
+        weights and activations of the encoder's attention projections and
+        `MixFFN` layers in place for faster, smaller inference. The
+        convolutions - patch embeddings, the fuse convolution and the final
+        `"segmentation_output"` convolution that produces per-class
+        scores - stay in floating point; keeping the output convolution
+        unquantized is also what preserves segmentation accuracy, and this
+        method verifies that exclusion explicitly.
+
+        Requires a multi-backend Keras 3 installation.
+
+        Args:
+            mode: the quantization mode to apply, e.g. `"int8"`.
+                Forwarded to `keras.Model.quantize`.
+        """
+        if not hasattr(keras.Model, "quantize"):
+            raise NotImplementedError(
+                "`quantize` requires the `keras.Model.quantize` API, which "
+                "is only available when using multi-backend Keras 3."
+            )
+        super().quantize(mode, **kwargs)
+        # Keras does not currently quantize `Conv2D` layers; verify the
+        # exclusion explicitly so that a future Keras version which can
+        # will not silently quantize the accuracy-sensitive output
+        # convolution.
+        output_policy = self.get_layer("segmentation_output").dtype_policy
+        if output_policy.name.startswith(mode):
+            raise RuntimeError(
+                "The `segmentation_output` convolution was unexpectedly "
+                "quantized. This layer must stay in floating point to "
+                "preserve segmentation accuracy."
+            )
+
     def get_config(self):
         config = super().get_config()
         config.update(
@@ -168,10 +292,10 @@ class SegFormer(Task):
     @classproperty
     def presets(cls):
         """Dictionary of preset names and configurations."""
-        return copy.deepcopy(presets)
+        return _segformer_presets()
 
     @classproperty
     def presets_with_weights(cls):
         """Dictionary of preset names and configurations that include
         weights."""
-        return copy.deepcopy(presets_with_weights)
+        return _segformer_presets_with_weights()
@@ -21,7 +21,7 @@ presets_no_weights = {
     "segformer_b0": {
         "metadata": {
             "description": ("SegFormer model with MiTB0 backbone."),
-            "params": 3719027,
+            "params": 3455859,
             "official_name": "SegFormerB0",
             "path": "segformer_b0",
         },
@@ -33,7 +33,7 @@ presets_no_weights = {
     "segformer_b1": {
         "metadata": {
             "description": ("SegFormer model with MiTB1 backbone."),
-            "params": 13682643,
+            "params": 13419475,
             "official_name": "SegFormerB1",
             "path": "segformer_b1",
         },
@@ -43,7 +43,7 @@ presets_no_weights = {
     "segformer_b2": {
         "metadata": {
             "description": ("SegFormer model with MiTB2 backbone."),
-            "params": 24727507,
+            "params": 24464339,
             "official_name": "SegFormerB2",
             "path": "segformer_b2",
         },
@@ -53,7 +53,7 @@ presets_no_weights = {
     "segformer_b3": {
         "metadata": {
             "description": ("SegFormer model with MiTB3 backbone."),
-            "params": 44603347,
+            "params": 44340179,
             "official_name": "SegFormerB3",
             "path": "segformer_b3",
         },
@@ -63,7 +63,7 @@ presets_no_weights = {
     "segformer_b4": {
         "metadata": {
             "description": ("SegFormer model with MiTB4 backbone."),
-            "params": 61373907,
+            "params": 61110739,
             "official_name": "SegFormerB4",
             "path": "segformer_b4",
         },
@@ -73,7 +73,7 @@ presets_no_weights = {
     "segformer_b5": {
         "metadata": {
             "description": ("SegFormer model with MiTB5 backbone."),
-            "params": 81974227,
+            "params": 81711059,
             "official_name": "SegFormerB5",
             "path": "segformer_b5",
         },
@@ -88,7 +88,7 @@ presets_with_weights = {
             "description": (
                 "SegFormer model with a pretrained MiTB0 backbone."
             ),
-            "params": 3719027,
+            "params": 3455859,
             "official_name": "SegFormerB0",
             "path": "segformer_b0",
         },
@@ -70,6 +70,74 @@ class SegFormerTest(TestCase):
             self.assertNotAllEqual(w1, w2)
             self.assertFalse(ops.any(ops.isnan(w2)))
 
+    @pytest.mark.large
+    def test_compile_xla(self):
+        backbone = MiTBackbone.from_preset("mit_b0", input_shape=[512, 512, 3])
+        model = SegFormer(backbone=backbone, num_classes=1)
+
+        if keras.backend.backend() != "tensorflow":
+            with self.assertRaises(NotImplementedError):
+                model.compile_xla()
+            return
+
+        model.compile_xla()
+        compiled_call = model.call
+        # Idempotent - a second call must not re-wrap the compiled function.
+        model.compile_xla()
+        self.assertIs(model.call, compiled_call)
+
+        images = np.random.uniform(size=(2, 512, 512, 3))
+        output = model(images)
+        self.assertEqual(tuple(output.shape), (2, 512, 512, 1))
+
+    @pytest.mark.large
+    def test_fuse_bn_for_inference(self):
+        backbone = MiTBackbone.from_preset("mit_b0", input_shape=[512, 512, 3])
+        model = SegFormer(backbone=backbone, num_classes=1)
+
+        # Give the batch norm non-trivial statistics so the fold is
+        # actually exercised.
+        bn = model.get_layer("segmentation_fuse_bn")
+        bn.set_weights(
+            [
+                np.random.uniform(0.5, 1.5, w.shape).astype("float32")
+                for w in bn.get_weights()
+            ]
+        )
+
+        images = np.random.uniform(size=(2, 512, 512, 3))
+        original_output = model(images)
+        model.fuse_bn_for_inference()
+        fused_output = model(images)
+
+        self.assertAllClose(
+            original_output, fused_output, atol=1e-5, rtol=1e-5
+        )
+
+    @pytest.mark.large
+    def test_quantize_int8(self):
+        if not hasattr(keras.Model, "quantize"):
+            self.skipTest("`quantize` requires multi-backend Keras 3.")
+
+        backbone = MiTBackbone.from_preset("mit_b0", input_shape=[512, 512, 3])
+        model = SegFormer(backbone=backbone, num_classes=1)
+        model.quantize("int8")
+
+        # The attention Dense projections are quantized in place, while the
+        # output convolution stays in floating point.
+        attention = model.backbone.get_layer("hierarchical_encoder_0_0").attn
+        self.assertTrue(attention.q.dtype_policy.name.startswith("int8"))
+        self.assertFalse(
+            model.get_layer(
+                "segmentation_output"
+            ).dtype_policy.name.startswith("int8")
+        )
+
+        images = np.random.uniform(size=(2, 512, 512, 3))
+        output = model(images)
+        self.assertEqual(tuple(output.shape), (2, 512, 512, 1))
+        self.assertFalse(ops.any(ops.isnan(output)))
+
     @pytest.mark.large  # Saving is slow, so mark these large.
     def test_saved_model(self):
         target_size = [512, 512, 3]
@@ -13,6 +13,7 @@
 # limitations under the License.
 """Base class for Task models."""
 
+import copy
 import os
 
 from keras_cv.api_export import keras_cv_export
@@ -140,8 +141,11 @@ class Task(keras.Model):
             backbone = backbone_cls.from_preset(preset, load_weights)
             return cls(backbone, **kwargs)
 
-        # Otherwise must be one of class presets
-        config = metadata["config"]
+        # Otherwise must be one of class presets.
+        # `cls.presets` may return a cached dictionary, so copy the config
+        # before the nested mutation below to avoid corrupting the preset
+        # for later `from_preset` calls.
+        config = copy.deepcopy(metadata["config"])
         if input_shape is not None:
             config["backbone"]["config"]["input_shape"] = input_shape
         model = cls.from_config({**config, **kwargs})